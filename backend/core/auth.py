@@ -1,23 +1,63 @@
-from datetime import datetime, timedelta
+import copy
+import time
+from datetime import timedelta
 from typing import Any, Dict, Optional
 
-import boto3
+import orjson
 from botocore.exceptions import ClientError
 from fastapi import HTTPException, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jws, jwt
 from passlib.context import CryptContext
 
+from core import log_ids
+from core.aws import dynamodb
 from core.config import settings
+from core.ttl_cache import put_with_ttl
 
 
 security = HTTPBearer()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# DynamoDB client for user management
-dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
+# Prepared once so jose doesn't rebuild the HMAC key for every token
+jwt_signing_key = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+
+# DynamoDB table for user management
 users_table = dynamodb.Table("themisguard-users")
 
+# user_id -> (expires_at, user item) for authenticated requests; the token is
+# still verified on every call, only the user lookup is skipped. Secrets are
+# stripped before caching and every caller gets its own copy.
+USER_CACHE_TTL_SECONDS = 60.0
+USER_CACHE_MAX_ENTRIES = 1024
+USER_SECRET_ATTRIBUTES = ("password_hash",)
+_user_cache: Dict[str, tuple] = {}
+
+
+def invalidate_cached_user(user_id: str):
+    """Drop a user's cached item after it changes in DynamoDB"""
+    _user_cache.pop(user_id, None)
+
+
+def update_user_attributes(user_id: str, values: Dict[str, Any]):
+    """SET attributes on a user item and drop its cached copy
+
+    User updates (profile, password, role, status, ...) go through here so the
+    authentication cache never serves a stale item.
+    """
+    users_table.update_item(
+        Key={"user_id": user_id},
+        UpdateExpression="SET " + ", ".join(f"#{name} = :{name}" for name in values),
+        ExpressionAttributeNames={f"#{name}": name for name in values},
+        ExpressionAttributeValues={f":{name}": value for name, value in values.items()},
+    )
+    invalidate_cached_user(user_id)
+
+
+def email_log_id(email: str) -> str:
+    """Log-safe id for an email address, keyed with the JWT secret"""
+    return log_ids.email_log_id(email, settings.JWT_SECRET_KEY)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -32,23 +72,25 @@ def get_password_hash(password: str) -> str:
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(hours=settings.JWT_EXPIRATION_HOURS)
-
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+    if not expires_delta:
+        expires_delta = timedelta(hours=settings.JWT_EXPIRATION_HOURS)
+
+    # Integer epoch seconds straight from the clock; jose would otherwise
+    # convert a datetime through utctimetuple() on every token
+    to_encode["exp"] = int(time.time() + expires_delta.total_seconds())
+
+    # All claims are JSON-native by now, so sign orjson's bytes directly
+    # rather than letting jwt.encode re-walk and json.dumps the dict
+    return jws.sign(
+        orjson.dumps(to_encode), jwt_signing_key, algorithm=settings.JWT_ALGORITHM
     )
-    return encoded_jwt
 
 
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """Verify JWT token and return payload"""
     try:
         payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+            token, jwt_signing_key, algorithms=[settings.JWT_ALGORITHM]
         )
         return payload
     except JWTError:
@@ -77,6 +119,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cached = _user_cache.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        return copy.deepcopy(cached[1])
+
     try:
         # Get user from DynamoDB
         response = users_table.get_item(Key={"user_id": user_id})
@@ -89,7 +135,12 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        return user
+        for name in USER_SECRET_ATTRIBUTES:
+            user.pop(name, None)
+        put_with_ttl(
+            _user_cache, user_id, user, USER_CACHE_TTL_SECONDS, USER_CACHE_MAX_ENTRIES
+        )
+        return copy.deepcopy(user)
 
     except ClientError:
         raise HTTPException(status_code=500, detail="Database error")
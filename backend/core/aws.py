@@ -0,0 +1,27 @@
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+
+from .config import settings
+
+
+# One boto3 session per container: credentials are resolved once and every
+# service shares the same DynamoDB resource and client connection pools
+session = boto3.Session(region_name=settings.AWS_REGION)
+
+AWS_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=2,
+    read_timeout=5,
+)
+
+dynamodb = session.resource("dynamodb", config=AWS_CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=None)
+def get_client(service_name: str):
+    """Shared low-level client for an AWS service (s3, kms, sns, ...)"""
+    return session.client(service_name, config=AWS_CLIENT_CONFIG)
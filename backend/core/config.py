@@ -38,6 +38,10 @@ class Settings(BaseSettings):
         "GCP_CREDENTIALS_TABLE", "compliantguard-gcp-credentials"
     )
 
+    # Audit logging: fraction of events a caller explicitly marks routine and
+    # non-PHI that are recorded; everything else is always kept
+    AUDIT_SAMPLE_RATE: float = float(os.getenv("AUDIT_SAMPLE_RATE", "1.0"))
+
     # Stripe Configuration
     STRIPE_SECRET_KEY: str = os.getenv("STRIPE_SECRET_KEY", "sk_test_...")
     STRIPE_PUBLISHABLE_KEY: str = os.getenv("STRIPE_PUBLISHABLE_KEY", "pk_test_...")
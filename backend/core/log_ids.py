@@ -0,0 +1,16 @@
+import hashlib
+
+
+def email_log_id(email: str, key: str) -> str:
+    """Pseudonymous, stable id for an email address, for use in log lines
+
+    Email addresses are PII and must not reach CloudWatch. The hash is keyed
+    with a server-side secret so log readers can't reverse it by hashing
+    candidate addresses. Kept free of other imports so main.py and core.auth
+    share one definition.
+    """
+    return hashlib.blake2b(
+        email.strip().lower().encode(),
+        digest_size=8,
+        key=key.encode()[:64],
+    ).hexdigest()
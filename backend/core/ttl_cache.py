@@ -0,0 +1,26 @@
+import time
+from typing import Any, Dict, Hashable
+
+
+def put_with_ttl(
+    cache: Dict[Hashable, tuple],
+    key: Hashable,
+    value: Any,
+    ttl: float,
+    max_entries: int,
+):
+    """Store (expires_at, value) under key, evicting expired and excess entries
+
+    Every entry in a cache shares one TTL and is re-inserted on update, so
+    insertion order is expiry order: pruning pops from the front until the
+    oldest entry is live and there is room, which keeps the dict bounded
+    without scanning it.
+    """
+    now = time.monotonic()
+    cache.pop(key, None)
+    while cache:
+        oldest = next(iter(cache))
+        if cache[oldest][0] > now and len(cache) < max_entries:
+            break
+        del cache[oldest]
+    cache[key] = (now + ttl, value)
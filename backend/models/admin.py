@@ -1,6 +1,7 @@
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -21,12 +22,27 @@ class AdminPermission(str, Enum):
     VIEW_AUDIT_LOGS = "view_audit_logs"
 
 
+# Model fields validate against plain string literals, which pydantic checks
+# with a string compare and keeps as str; the str enums above remain for
+# symbolic names and compare and hash equal to these values
+AdminRoleName = Literal["super_admin", "admin", "viewer"]
+AdminPermissionName = Literal[
+    "view_customers",
+    "view_revenue",
+    "view_analytics",
+    "manage_subscriptions",
+    "view_system_health",
+    "manage_users",
+    "view_audit_logs",
+]
+
+
 class AdminUser(BaseModel):
     admin_id: str
     email: str
     name: str
-    role: AdminRole
-    permissions: List[AdminPermission]
+    role: AdminRoleName
+    permissions: FrozenSet[AdminPermissionName]  # Parsed once; O(1) membership
     is_active: bool = True
     last_login: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.now)
@@ -38,7 +54,8 @@ class AdminUser(BaseModel):
     backup_codes: Optional[List[str]] = None  # Encrypted backup codes
 
 
-class ChurnAnalytics(BaseModel):
+@dataclass(slots=True)
+class ChurnAnalytics:
     """Comprehensive churn analytics"""
 
     # Current churn metrics
@@ -91,7 +108,8 @@ class ChurnAnalytics(BaseModel):
     saved_revenue_from_retention_efforts: float
 
 
-class CustomerMetrics(BaseModel):
+@dataclass(slots=True)
+class CustomerMetrics:
     """Aggregated customer metrics - no PII data"""
 
     total_customers: int
@@ -125,7 +143,8 @@ class CustomerMetrics(BaseModel):
     critical_customers: int  # Payment issues, low engagement
 
 
-class RevenueMetrics(BaseModel):
+@dataclass(slots=True)
+class RevenueMetrics:
     """Aggregated revenue metrics"""
 
     monthly_recurring_revenue: float
@@ -139,7 +158,8 @@ class RevenueMetrics(BaseModel):
     projected_revenue: float
 
 
-class UsageMetrics(BaseModel):
+@dataclass(slots=True)
+class UsageMetrics:
     """Aggregated usage analytics"""
 
     total_scans: int
@@ -152,7 +172,8 @@ class UsageMetrics(BaseModel):
     resource_utilization: Dict[str, float]
 
 
-class SystemHealthMetrics(BaseModel):
+@dataclass(slots=True)
+class SystemHealthMetrics:
     """System operational metrics"""
 
     api_uptime: float
@@ -166,7 +187,8 @@ class SystemHealthMetrics(BaseModel):
     database_performance: Dict[str, Any]
 
 
-class SupportMetrics(BaseModel):
+@dataclass(slots=True)
+class SupportMetrics:
     """Customer support metrics"""
 
     open_tickets: int
@@ -177,7 +199,8 @@ class SupportMetrics(BaseModel):
     support_response_time: float
 
 
-class SecurityMetrics(BaseModel):
+@dataclass(slots=True)
+class SecurityMetrics:
     """Security and compliance metrics"""
 
     failed_login_attempts: int
@@ -189,6 +212,10 @@ class SecurityMetrics(BaseModel):
     security_incidents: List[Dict[str, Any]]
 
 
+# The metric containers above are plain slotted dataclasses: they are only
+# filled in by AdminService from already-typed aggregates. Pydantic still
+# validates them as fields of AdminDashboardData when a cached dashboard is
+# loaded back from DynamoDB, and serializes them in .dict().
 class AdminDashboardData(BaseModel):
     """Complete admin dashboard data - aggregated and anonymized"""
 
@@ -233,7 +260,8 @@ class AdminSession(BaseModel):
 
 
 # Data aggregation models for privacy protection
-class CustomerSummary(BaseModel):
+@dataclass(slots=True)
+class CustomerSummary:
     """Non-PII customer summary for admin dashboard"""
 
     customer_count: int
@@ -244,7 +272,8 @@ class CustomerSummary(BaseModel):
     churn_analysis: Dict[str, Any]
 
 
-class RevenueSummary(BaseModel):
+@dataclass(slots=True)
+class RevenueSummary:
     """Revenue summary for admin dashboard"""
 
     current_mrr: float
@@ -254,7 +283,8 @@ class RevenueSummary(BaseModel):
     forecast: Dict[str, float]
 
 
-class ComplianceMetrics(BaseModel):
+@dataclass(slots=True)
+class ComplianceMetrics:
     """Compliance-related metrics for admin oversight"""
 
     total_scans_performed: int
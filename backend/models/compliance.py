@@ -33,6 +33,18 @@ class Violation(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class ViolationAnalysis(BaseModel):
+    violations: List[Violation] = Field(
+        default=[], description="List of violations found"
+    )
+    violations_by_severity: Dict[ViolationSeverity, int] = Field(
+        default={}, description="Violations grouped by severity"
+    )
+    violations_by_type: Dict[ViolationType, int] = Field(
+        default={}, description="Violations grouped by type"
+    )
+
+
 class ComplianceReport(BaseModel):
     scan_id: str = Field(..., description="Unique scan identifier")
     user_id: str = Field(..., description="User who initiated the scan")
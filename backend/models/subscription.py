@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -26,7 +27,11 @@ class BillingInterval(str, Enum):
     ANNUAL = "year"
 
 
-class PricingPlan(BaseModel):
+# Plans are module-level singletons shared by every subscription, so they are
+# frozen slotted dataclasses rather than models; pydantic still validates and
+# serializes them as the CustomerSubscription.plan field.
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PricingPlan:
     """ThemisGuard subscription plans"""
 
     plan_id: str
@@ -1,26 +1,90 @@
+import logging
 import uuid
 from datetime import datetime
 from typing import Optional
 
-import boto3
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 from core.auth import (
     create_access_token,
+    email_log_id,
     get_current_user,
     get_password_hash,
+    update_user_attributes,
     verify_password,
 )
-from core.config import settings
+from core.aws import dynamodb, get_client
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, EmailStr
 
 
 router = APIRouter()
 
-# DynamoDB client
-dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
+logger = logging.getLogger("themisguard.routes.auth")
+
+# Users table on the shared DynamoDB resource
 users_table = dynamodb.Table("themisguard-users")
 
+# Login reads through the low-level client and deserializes only the
+# attributes it uses instead of the resource layer walking the whole item
+dynamodb_client = get_client("dynamodb")
+deserializer = TypeDeserializer()
+LOGIN_ATTRIBUTES = ("user_id", "email", "password_hash", "profile", "plan_tier")
+
+# Users are keyed by a generated user_id, so email uniqueness is enforced by
+# a claim item keyed on the email, written in the same transaction as the
+# user. Claims carry no email attribute and never appear in email-index.
+EMAIL_CLAIM_PREFIX = "email#"
+
+
+def put_new_user(user_item: dict):
+    """Store a new user, failing if its email has already been claimed"""
+    dynamodb.meta.client.transact_write_items(
+        TransactItems=[
+            {
+                "Put": {
+                    "TableName": users_table.name,
+                    "Item": user_item,
+                    "ConditionExpression": "attribute_not_exists(user_id)",
+                }
+            },
+            {
+                "Put": {
+                    "TableName": users_table.name,
+                    "Item": {
+                        "user_id": EMAIL_CLAIM_PREFIX + user_item["email"],
+                        "owner_user_id": user_item["user_id"],
+                        "created_at": user_item["created_at"],
+                    },
+                    "ConditionExpression": "attribute_not_exists(user_id)",
+                }
+            },
+        ]
+    )
+
+
+def get_claimed_user(email: str) -> dict:
+    """The user that owns an email claim, read consistently from the table
+
+    Used after losing a sign-up race, when the winner may not be visible in
+    the eventually consistent email-index yet.
+    """
+    claim = users_table.get_item(
+        Key={"user_id": EMAIL_CLAIM_PREFIX + email}, ConsistentRead=True
+    )["Item"]
+    return users_table.get_item(
+        Key={"user_id": claim["owner_user_id"]}, ConsistentRead=True
+    )["Item"]
+
+
+def is_conditional_check_failure(error: ClientError) -> bool:
+    """True when a transaction was cancelled by one of its conditions"""
+    return any(
+        reason.get("Code") == "ConditionalCheckFailed"
+        for reason in error.response.get("CancellationReasons", [])
+    )
+
 
 class UserRegistration(BaseModel):
     first_name: str
@@ -45,25 +109,33 @@ class GoogleSSOData(BaseModel):
 @router.post("/register")
 async def register_user(user_data: UserRegistration):
     """Register a new user"""
-    print(f"📝 User registration attempt: {user_data.email}")
-    print(f"🏢 Company: {user_data.company}")
-    print(f"👤 Name: {user_data.first_name} {user_data.last_name}")
+    logger.debug("User registration attempt email_id=%s", email_log_id(user_data.email))
 
     try:
-        # Check if user already exists
-        print(f"🔍 Checking if user exists: {user_data.email}")
+        # Check if user already exists; items are keyed by a generated
+        # user_id, so the check has to go through the email GSI. This catches
+        # accounts created before email claims existed; concurrent sign-ups
+        # are caught by the claim in put_new_user.
         try:
-            response = users_table.get_item(Key={"user_id": user_data.email})
-            print(f"📊 DynamoDB response keys: {response.keys()}")
-            if response.get("Item"):
-                print(f"⚠️ User already exists: {user_data.email}")
+            response = users_table.query(
+                IndexName="email-index",
+                KeyConditionExpression=Key("email").eq(user_data.email),
+                Select="COUNT",
+                Limit=1,
+            )
+            if response["Count"]:
+                logger.info(
+                    "Registration for existing email_id=%s",
+                    email_log_id(user_data.email),
+                )
                 raise HTTPException(
                     status_code=400, detail="User with this email already exists"
                 )
-            print("✅ User does not exist, proceeding with registration")
         except ClientError as e:
-            print(
-                f"❌ DynamoDB ClientError: {e.response['Error']['Code']} - {e.response['Error']['Message']}"
+            logger.warning(
+                "DynamoDB error checking user: %s - %s",
+                e.response["Error"]["Code"],
+                e.response["Error"]["Message"],
             )
             if e.response["Error"]["Code"] != "ResourceNotFoundException":
                 raise HTTPException(
@@ -73,10 +145,7 @@ async def register_user(user_data: UserRegistration):
 
         # Create new user
         user_id = str(uuid.uuid4())
-        print(f"🆔 Generated user ID: {user_id}")
-
         hashed_password = get_password_hash(user_data.password)
-        print("🔐 Password hashed successfully")
 
         user_item = {
             "user_id": user_id,
@@ -95,12 +164,19 @@ async def register_user(user_data: UserRegistration):
             "status": "active",
         }
 
-        print(f"💾 Storing user in DynamoDB: {users_table.table_name}")
-        print(f"📝 User item keys: {list(user_item.keys())}")
-
-        # Store in DynamoDB
-        users_table.put_item(Item=user_item)
-        print("✅ User stored successfully in DynamoDB")
+        # Store in DynamoDB together with the email claim
+        try:
+            put_new_user(user_item)
+        except ClientError as e:
+            if not is_conditional_check_failure(e):
+                raise
+            logger.info(
+                "Registration for existing email_id=%s", email_log_id(user_data.email)
+            )
+            raise HTTPException(
+                status_code=400, detail="User with this email already exists"
+            )
+        logger.debug("User registered user=%s", user_id)
 
         # Create access token
         token_data = {"sub": user_id, "email": user_data.email}
@@ -117,58 +193,55 @@ async def register_user(user_data: UserRegistration):
             },
         }
 
-    except ClientError as e:
-        print(f"DynamoDB error: {e}")
+    except HTTPException:
+        raise
+    except ClientError:
+        logger.exception("DynamoDB error during registration")
         raise HTTPException(status_code=500, detail="Failed to create user")
-    except Exception as e:
-        print(f"Registration error: {e}")
+    except Exception:
+        logger.exception("Registration error")
         raise HTTPException(status_code=500, detail="Registration failed")
 
 
 @router.post("/login")
 async def login_user(login_data: UserLogin):
     """Login user with email/password"""
-    print(f"🔑 Login attempt for: {login_data.email}")
-    print(f"📊 Using table: {users_table.table_name}")
-    print(f"🌍 AWS Region: {settings.AWS_REGION}")
+    logger.debug("Login attempt email_id=%s", email_log_id(login_data.email))
 
     try:
-        # Get user from DynamoDB (using email as lookup)
-        print(f"🔍 Scanning DynamoDB for user: {login_data.email}")
-        print("📊 Filter expression: email = :email")
-
-        response = users_table.scan(
-            FilterExpression="email = :email",
-            ExpressionAttributeValues={":email": login_data.email},
+        # Look the user up through the email GSI; a filtered scan reads the
+        # whole table on every login attempt
+        response = dynamodb_client.query(
+            TableName=users_table.name,
+            IndexName="email-index",
+            KeyConditionExpression="email = :email",
+            ExpressionAttributeValues={":email": {"S": login_data.email}},
+            Limit=1,
         )
 
-        print(f"📊 Scan response keys: {response.keys()}")
-        print(f"📊 Scan count: {response.get('Count', 0)} items found")
-        print(f"📊 Scanned count: {response.get('ScannedCount', 0)} items scanned")
-
         users = response.get("Items", [])
         if not users:
-            print(f"❌ No user found with email: {login_data.email}")
+            logger.info("Login for unknown email_id=%s", email_log_id(login_data.email))
             raise HTTPException(status_code=401, detail="Invalid email or password")
 
-        user = users[0]
-        print(f"✅ User found: {user.get('user_id', 'unknown')}")
-        print(f"📝 User keys: {list(user.keys())}")
-        print(f"🔐 Has password hash: {'password_hash' in user}")
+        item = users[0]
+        user = {
+            name: deserializer.deserialize(item[name])
+            for name in LOGIN_ATTRIBUTES
+            if name in item
+        }
 
         # Verify password
-        print("🔐 Verifying password...")
         if not verify_password(login_data.password, user["password_hash"]):
-            print(f"❌ Password verification failed for: {login_data.email}")
+            logger.info(
+                "Password verification failed email_id=%s",
+                email_log_id(login_data.email),
+            )
             raise HTTPException(status_code=401, detail="Invalid email or password")
 
-        print("✅ Password verified successfully")
-
         # Create access token
-        print("🎫 Creating access token...")
         token_data = {"sub": user["user_id"], "email": user["email"]}
         access_token = create_access_token(token_data)
-        print("✅ Access token created")
 
         user_response = {
             "user_id": user["user_id"],
@@ -177,8 +250,7 @@ async def login_user(login_data: UserLogin):
             "plan_tier": user.get("plan_tier", "free"),
         }
 
-        print(f"🎉 Login successful for: {login_data.email}")
-        print(f"👤 Returning user data: {list(user_response.keys())}")
+        logger.debug("Login successful user=%s", user["user_id"])
 
         return {
             "access_token": access_token,
@@ -186,70 +258,58 @@ async def login_user(login_data: UserLogin):
             "user": user_response,
         }
 
-    except HTTPException as http_ex:
-        print(f"❌ HTTP Exception during login: {http_ex.detail}")
+    except HTTPException:
         raise
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        error_msg = e.response["Error"]["Message"]
-        print(f"❌ DynamoDB ClientError during login: {error_code} - {error_msg}")
-        print(f"📊 Full error response: {e.response}")
+        logger.error(
+            "DynamoDB error during login: %s - %s",
+            error_code,
+            e.response["Error"]["Message"],
+        )
         raise HTTPException(status_code=500, detail=f"Database error: {error_code}")
-    except Exception as e:
-        print(f"❌ Unexpected login error: {type(e).__name__}: {str(e)}")
-        print(f"📊 Exception details: {repr(e)}")
+    except Exception:
+        logger.exception("Unexpected login error")
         raise HTTPException(status_code=500, detail="Login failed")
 
 
 @router.post("/google-sso")
 async def google_sso_login(google_data: GoogleSSOData):
     """Login/register user with Google SSO"""
-    print(f"🔐 Google SSO login attempt for: {google_data.email}")
-    print(f"🆔 Google ID: {google_data.google_id}")
-    print(f"👤 Name: {google_data.name}")
-    print(f"🖼️ Has picture: {bool(google_data.picture)}")
+    logger.debug(
+        "Google SSO login attempt email_id=%s", email_log_id(google_data.email)
+    )
 
     try:
         # Check if user exists
-        print(f"🔍 Checking if user exists: {google_data.email}")
-        response = users_table.scan(
-            FilterExpression="email = :email",
-            ExpressionAttributeValues={":email": google_data.email},
+        response = users_table.query(
+            IndexName="email-index",
+            KeyConditionExpression=Key("email").eq(google_data.email),
+            Limit=1,
         )
 
-        print(f"📊 Scan response: {response.get('Count', 0)} items found")
         users = response.get("Items", [])
 
         if users:
             # Existing user - update Google ID if needed
             user = users[0]
-            print(f"✅ Existing user found: {user.get('user_id')}")
-            print(f"🔍 Current Google ID: {user.get('google_id')}")
-            print(f"🔍 New Google ID: {google_data.google_id}")
 
             if user.get("google_id") != google_data.google_id:
-                print("🔄 Updating Google ID for user")
-                users_table.update_item(
-                    Key={"user_id": user["user_id"]},
-                    UpdateExpression="SET google_id = :google_id, updated_at = :updated_at",
-                    ExpressionAttributeValues={
-                        ":google_id": google_data.google_id,
-                        ":updated_at": datetime.utcnow().isoformat(),
+                update_user_attributes(
+                    user["user_id"],
+                    {
+                        "google_id": google_data.google_id,
+                        "updated_at": datetime.utcnow().isoformat(),
                     },
                 )
-                print("✅ Google ID updated successfully")
-            else:
-                print("ℹ️ Google ID already up to date")
+                logger.debug("Updated Google ID user=%s", user["user_id"])
         else:
             # New user - create from Google data
-            print("👤 Creating new user from Google data")
             user_id = str(uuid.uuid4())
-            print(f"🆔 Generated user ID: {user_id}")
 
             name_parts = google_data.name.split(" ", 1)
             first_name = name_parts[0]
             last_name = name_parts[1] if len(name_parts) > 1 else ""
-            print(f"📝 Parsed name: {first_name} {last_name}")
 
             user = {
                 "user_id": user_id,
@@ -268,16 +328,20 @@ async def google_sso_login(google_data: GoogleSSOData):
                 "status": "active",
             }
 
-            print("💾 Storing new user in DynamoDB")
-            print(f"📝 User item keys: {list(user.keys())}")
-            users_table.put_item(Item=user)
-            print("✅ New user created successfully")
+            try:
+                put_new_user(user)
+                logger.debug("Created user from Google SSO user=%s", user_id)
+            except ClientError as e:
+                if not is_conditional_check_failure(e):
+                    raise
+                # A concurrent first sign-in claimed this email; continue as
+                # the user it created
+                user = get_claimed_user(google_data.email)
+                logger.debug("Google SSO joined existing user=%s", user["user_id"])
 
         # Create access token
-        print(f"🎫 Creating access token for: {user['email']}")
         token_data = {"sub": user["user_id"], "email": user["email"]}
         access_token = create_access_token(token_data)
-        print("✅ Access token created")
 
         user_response = {
             "user_id": user["user_id"],
@@ -286,8 +350,7 @@ async def google_sso_login(google_data: GoogleSSOData):
             "plan_tier": user.get("plan_tier", "free"),
         }
 
-        print(f"🎉 Google SSO successful for: {google_data.email}")
-        print(f"👤 Returning user data: {list(user_response.keys())}")
+        logger.debug("Google SSO successful user=%s", user["user_id"])
 
         return {
             "access_token": access_token,
@@ -297,24 +360,20 @@ async def google_sso_login(google_data: GoogleSSOData):
 
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        error_msg = e.response["Error"]["Message"]
-        print(f"❌ DynamoDB ClientError during Google SSO: {error_code} - {error_msg}")
-        print(f"📊 Full error response: {e.response}")
+        logger.error(
+            "DynamoDB error during Google SSO: %s - %s",
+            error_code,
+            e.response["Error"]["Message"],
+        )
         raise HTTPException(status_code=500, detail=f"Database error: {error_code}")
-    except Exception as e:
-        print(f"❌ Unexpected Google SSO error: {type(e).__name__}: {str(e)}")
-        print(f"📊 Exception details: {repr(e)}")
+    except Exception:
+        logger.exception("Unexpected Google SSO error")
         raise HTTPException(status_code=500, detail="Google SSO failed")
 
 
 @router.get("/verify")
 async def verify_token(current_user: dict = Depends(get_current_user)):
     """Verify JWT token and return user info"""
-    print("🔍 Token verification request")
-    print(f"👤 Current user ID: {current_user.get('user_id', 'unknown')}")
-    print(f"📧 Current user email: {current_user.get('email', 'unknown')}")
-    print(f"📝 User data keys: {list(current_user.keys())}")
-
     user_response = {
         "user_id": current_user["user_id"],
         "email": current_user["email"],
@@ -322,7 +381,6 @@ async def verify_token(current_user: dict = Depends(get_current_user)):
         "plan_tier": current_user.get("plan_tier", "free"),
     }
 
-    print("✅ Token verification successful")
-    print(f"👤 Returning user data: {list(user_response.keys())}")
+    logger.debug("Token verified user=%s", current_user["user_id"])
 
     return {"user": user_response}
@@ -0,0 +1,9 @@
+#!/bin/bash
+# Lambda entrypoint: started by the Lambda Web Adapter (AWS_LAMBDA_EXEC_WRAPPER),
+# which translates API Gateway events into HTTP requests to this server.
+# Lambda freezes the environment as soon as the response is returned, so
+# handlers must finish their writes first: no BackgroundTasks, daemon-thread
+# queues or other work scheduled to run after the response.
+PATH=$PATH:$LAMBDA_TASK_ROOT/bin \
+    PYTHONPATH=$PYTHONPATH:/opt/python:$LAMBDA_RUNTIME_DIR \
+    exec python -m uvicorn --port="$PORT" --loop uvloop --http httptools main:asgi_app
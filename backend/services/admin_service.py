@@ -1,15 +1,19 @@
-import hashlib
+import logging
 import secrets
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-import boto3
 import pyotp
+from fastapi import HTTPException, Security
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from passlib.context import CryptContext
 
-from ..core.config import settings
+from ..core.aws import dynamodb, get_client
 from ..models.admin import (
     AdminAuditLog,
     AdminDashboardData,
+    AdminPermission,
     AdminSession,
     AdminUser,
     ChurnAnalytics,
@@ -22,10 +26,17 @@ from ..models.admin import (
 )
 
 
+logger = logging.getLogger("themisguard.admin_service")
+
+# bcrypt for new hashes; unsalted hex SHA-256 from older admin records still
+# verifies and is rehashed to bcrypt on the next successful login
+pwd_context = CryptContext(schemes=["bcrypt", "hex_sha256"], deprecated="auto")
+
+
 class AdminService:
     def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
-        self.s3 = boto3.client("s3", region_name=settings.AWS_REGION)
+        self.dynamodb = dynamodb
+        self.s3 = get_client("s3")
 
         # Admin-specific tables (separate from customer data)
         self.admin_users_table = self.dynamodb.Table("themisguard-admin-users")
@@ -53,11 +64,15 @@ class AdminService:
 
             admin_user = response["Item"]
 
-            # Verify password (in production, use proper password hashing)
+            # Verify password; bcrypt is deliberately slow, keep it off the loop
             stored_password_hash = admin_user.get("password_hash")
-            password_hash = hashlib.sha256(password.encode()).hexdigest()
+            password_valid, upgraded_hash = False, None
+            if stored_password_hash:
+                password_valid, upgraded_hash = await run_in_threadpool(
+                    pwd_context.verify_and_update, password, stored_password_hash
+                )
 
-            if stored_password_hash != password_hash:
+            if not password_valid:
                 await self.log_admin_action(
                     admin_id=admin_user["admin_id"],
                     admin_email=email,
@@ -69,6 +84,13 @@ class AdminService:
                 )
                 return {"success": False, "error": "Invalid credentials"}
 
+            if upgraded_hash:
+                self.admin_users_table.update_item(
+                    Key={"admin_id": admin_user["admin_id"]},
+                    UpdateExpression="SET password_hash = :password_hash",
+                    ExpressionAttributeValues={":password_hash": upgraded_hash},
+                )
+
             # Check if admin is active
             if not admin_user.get("is_active", False):
                 return {"success": False, "error": "Account disabled"}
@@ -91,7 +113,7 @@ class AdminService:
             return {"success": True, "requires_2fa": True, "temp_token": temp_token}
 
         except Exception as e:
-            print(f"Admin authentication error: {e}")
+            logger.error("Admin authentication error: %s", e)
             return {"success": False, "error": "Authentication failed"}
 
     async def verify_2fa(
@@ -200,7 +222,7 @@ class AdminService:
             }
 
         except Exception as e:
-            print(f"2FA verification error: {e}")
+            logger.error("2FA verification error: %s", e)
             return {"success": False, "error": "2FA verification failed"}
 
     async def validate_admin_session(self, session_token: str) -> Optional[AdminUser]:
@@ -246,7 +268,7 @@ class AdminService:
             return None
 
         except Exception as e:
-            print(f"Session validation error: {e}")
+            logger.error("Session validation error: %s", e)
             return None
 
     async def get_admin_dashboard_data(self, admin_id: str) -> AdminDashboardData:
@@ -265,7 +287,7 @@ class AdminService:
             return await self.generate_admin_metrics()
 
         except Exception as e:
-            print(f"Error getting admin dashboard data: {e}")
+            logger.error("Error getting admin dashboard data: %s", e)
             # Return default/empty metrics
             return self.get_default_admin_metrics()
 
@@ -285,7 +307,7 @@ class AdminService:
             return None
 
         except Exception as e:
-            print(f"Error getting cached metrics: {e}")
+            logger.error("Error getting cached metrics: %s", e)
             return None
 
     async def generate_admin_metrics(self) -> AdminDashboardData:
@@ -601,7 +623,7 @@ class AdminService:
                 }
             )
         except Exception as e:
-            print(f"Error caching metrics: {e}")
+            logger.error("Error caching metrics: %s", e)
 
     def get_default_admin_metrics(self) -> AdminDashboardData:
         """Return default metrics in case of errors"""
@@ -717,7 +739,11 @@ class AdminService:
         resource_id: Optional[str] = None,
         user_agent: str = "",
     ):
-        """Log admin actions for audit trail"""
+        """Log admin actions for audit trail
+
+        Written before returning: a Lambda container is frozen once the
+        response is sent, so an entry deferred until then can be lost.
+        """
         try:
             audit_log = AdminAuditLog(
                 log_id=f"audit_{secrets.token_urlsafe(16)}",
@@ -732,10 +758,17 @@ class AdminService:
                 success=success,
             )
 
-            self.admin_audit_table.put_item(Item=audit_log.dict())
+            await run_in_threadpool(self.write_audit_log, audit_log.dict())
 
         except Exception as e:
-            print(f"Error logging admin action: {e}")
+            logger.error("Error logging admin action: %s", e)
+
+    def write_audit_log(self, item: Dict[str, Any]):
+        """Store a single admin audit log entry"""
+        try:
+            self.admin_audit_table.put_item(Item=item)
+        except Exception as e:
+            logger.error("Error logging admin action: %s", e)
 
     async def logout_admin(self, session_token: str, admin_id: str):
         """Logout admin and invalidate session"""
@@ -766,7 +799,7 @@ class AdminService:
             )
 
         except Exception as e:
-            print(f"Error logging out admin: {e}")
+            logger.error("Error logging out admin: %s", e)
 
     async def get_admin_audit_logs(
         self, admin_id: str, limit: int = 50
@@ -784,5 +817,26 @@ class AdminService:
             return [AdminAuditLog(**item) for item in response.get("Items", [])]
 
         except Exception as e:
-            print(f"Error getting audit logs: {e}")
+            logger.error("Error getting audit logs: %s", e)
             return []
+
+
+admin_security = HTTPBearer()
+
+
+def require_permission(permission: AdminPermission):
+    """Dependency that resolves the admin session and enforces ``permission``"""
+
+    async def check_permission(
+        credentials: HTTPAuthorizationCredentials = Security(admin_security),
+    ) -> AdminUser:
+        admin_user = await AdminService().validate_admin_session(
+            credentials.credentials
+        )
+        if not admin_user:
+            raise HTTPException(status_code=401, detail="Invalid admin session")
+        if permission not in admin_user.permissions:
+            raise HTTPException(status_code=403, detail="Insufficient permissions")
+        return admin_user
+
+    return check_permission
@@ -4,13 +4,15 @@ Comprehensive Audit Service - Complete audit logging and monitoring system
 
 import hashlib
 import json
+import logging
 import uuid
 from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
-import boto3
+import orjson
 
+from ..core.aws import dynamodb, get_client
 from ..core.config import settings
 from ..models.audit import (
     AccessResult,
@@ -24,15 +26,18 @@ from ..models.audit import (
 )
 
 
+logger = logging.getLogger("themisguard.audit_service")
+
+
 class AuditService:
     """
     Comprehensive audit logging service with real-time monitoring and anomaly detection
     """
 
     def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
-        self.kinesis = boto3.client("kinesis", region_name=settings.AWS_REGION)
-        self.sns = boto3.client("sns", region_name=settings.AWS_REGION)
+        self.dynamodb = dynamodb
+        self.kinesis = get_client("kinesis")
+        self.sns = get_client("sns")
 
         # Audit table names
         self.audit_table_name = "audit-logs"
@@ -42,6 +47,9 @@ class AuditService:
 
         # Initialize tables
         self.audit_table = self.dynamodb.Table(self.audit_table_name)
+        self.security_table = self.dynamodb.Table(self.security_events_table_name)
+        self.compliance_table = self.dynamodb.Table(self.compliance_events_table_name)
+        self.patterns_table = self.dynamodb.Table(self.patterns_table_name)
 
         # Real-time monitoring configuration
         self.kinesis_stream_name = "audit-stream"
@@ -69,20 +77,7 @@ class AuditService:
         """
 
         try:
-            # Convert to storage format
-            audit_record = event.to_dict()
-            audit_id = audit_record["audit_id"]
-
-            # Enrich with additional metadata
-            audit_record.update(
-                {
-                    "hash": self._calculate_event_hash(audit_record),
-                    "sequence_number": await self._get_next_sequence_number(),
-                    "source_service": "themisguard-api",
-                    "api_version": "1.0",
-                    "environment": settings.ENVIRONMENT,
-                }
-            )
+            audit_record = await self._build_audit_record(event)
 
             # Store in DynamoDB
             await self._store_audit_record(audit_record)
@@ -90,18 +85,9 @@ class AuditService:
             # Stream to Kinesis for real-time processing
             await self._stream_to_kinesis(audit_record)
 
-            # Check for anomalous patterns
-            await self._check_access_patterns(event)
-
-            # Handle specific event types
-            if event.result == AccessResult.DENIED:
-                await self._handle_access_denied(event)
-            elif event.event_type == EventType.PHI_ACCESS:
-                await self._handle_phi_access(event)
-            elif event.event_type == EventType.BULK_OPERATION:
-                await self._handle_bulk_operation(event)
+            await self._analyze_access_event(event)
 
-            return audit_id
+            return audit_record["audit_id"]
 
         except Exception as e:
             # Critical: audit failures must be logged elsewhere
@@ -116,8 +102,7 @@ class AuditService:
             security_id = security_record["security_event_id"]
 
             # Store security event
-            security_table = self.dynamodb.Table(self.security_events_table_name)
-            await security_table.put_item(Item=security_record)
+            self.security_table.put_item(Item=security_record)
 
             # Trigger immediate alerts for high/critical severity
             if event.severity in [Severity.HIGH, Severity.CRITICAL]:
@@ -140,8 +125,7 @@ class AuditService:
             compliance_id = compliance_record["compliance_event_id"]
 
             # Store compliance event
-            compliance_table = self.dynamodb.Table(self.compliance_events_table_name)
-            await compliance_table.put_item(Item=compliance_record)
+            self.compliance_table.put_item(Item=compliance_record)
 
             # Check for compliance violations
             if event.phi_accessed and not event.minimum_necessary:
@@ -215,7 +199,7 @@ class AuditService:
             return response.get("Items", [])
 
         except Exception as e:
-            print(f"Failed to retrieve audit trail: {e}")
+            logger.error("Failed to retrieve audit trail: %s", e)
             return []
 
     async def detect_anomalous_patterns(
@@ -306,7 +290,7 @@ class AuditService:
             return patterns
 
         except Exception as e:
-            print(f"Failed to detect anomalous patterns: {e}")
+            logger.error("Failed to detect anomalous patterns: %s", e)
             return []
 
     async def generate_compliance_report(
@@ -374,25 +358,52 @@ class AuditService:
             return report
 
         except Exception as e:
-            print(f"Failed to generate compliance report: {e}")
+            logger.error("Failed to generate compliance report: %s", e)
             return {}
 
     # Internal helper methods
 
+    async def _build_audit_record(self, event: AuditEvent) -> Dict[str, Any]:
+        """Storage format of an access event, enriched with integrity metadata"""
+        audit_record = event.to_dict()
+        audit_record.update(
+            {
+                "hash": self._calculate_event_hash(audit_record),
+                "sequence_number": await self._get_next_sequence_number(),
+                "source_service": "themisguard-api",
+                "api_version": "1.0",
+                "environment": settings.ENVIRONMENT,
+            }
+        )
+        return audit_record
+
+    async def _analyze_access_event(self, event: AuditEvent):
+        """Pattern checks and type-specific handling after an event is stored"""
+        # Check for anomalous patterns
+        await self._check_access_patterns(event)
+
+        # Handle specific event types
+        if event.result == AccessResult.DENIED:
+            await self._handle_access_denied(event)
+        elif event.event_type == EventType.PHI_ACCESS:
+            await self._handle_phi_access(event)
+        elif event.event_type == EventType.BULK_OPERATION:
+            await self._handle_bulk_operation(event)
+
     async def _store_audit_record(self, record: Dict[str, Any]):
         """Store audit record in DynamoDB"""
-        await self.audit_table.put_item(Item=record)
+        self.audit_table.put_item(Item=record)
 
     async def _stream_to_kinesis(self, record: Dict[str, Any]):
         """Stream audit event to Kinesis for real-time processing"""
         try:
             self.kinesis.put_record(
                 StreamName=self.kinesis_stream_name,
-                Data=json.dumps(record, default=str),
+                Data=orjson.dumps(record, default=str),
                 PartitionKey=record.get("customer_id", "system"),
             )
         except Exception as e:
-            print(f"Failed to stream to Kinesis: {e}")
+            logger.error("Failed to stream to Kinesis: %s", e)
 
     async def _check_access_patterns(self, event: AuditEvent):
         """Check for anomalous access patterns"""
@@ -498,15 +509,14 @@ class AuditService:
                     Subject=f"Security Alert: {event.event_type.value} ({event.severity.value})",
                 )
         except Exception as e:
-            print(f"Failed to send security alert: {e}")
+            logger.error("Failed to send security alert: %s", e)
 
     async def _store_access_pattern(self, pattern: DataAccessPattern):
         """Store detected access pattern"""
         try:
-            patterns_table = self.dynamodb.Table(self.patterns_table_name)
-            await patterns_table.put_item(Item=pattern.to_dict())
+            self.patterns_table.put_item(Item=pattern.to_dict())
         except Exception as e:
-            print(f"Failed to store access pattern: {e}")
+            logger.error("Failed to store access pattern: %s", e)
 
     async def _trigger_pattern_alert(self, pattern: DataAccessPattern):
         """Trigger alert for suspicious access pattern"""
@@ -582,4 +592,4 @@ class AuditService:
         }
 
         # Log to CloudWatch or separate audit system
-        print(f"AUDIT FAILURE: {json.dumps(failure_record)}")
+        logger.error("AUDIT FAILURE: %s", json.dumps(failure_record))
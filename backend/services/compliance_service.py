@@ -1,30 +1,41 @@
 import json
+import logging
 import subprocess
 import uuid
+from collections import Counter
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
+from ..core.aws import dynamodb, get_client
 from ..core.config import settings
 from ..models.compliance import (
     ComplianceReport,
     DashboardData,
     Violation,
+    ViolationAnalysis,
     ViolationSeverity,
+    ViolationSummary,
     ViolationType,
 )
 
 
+logger = logging.getLogger("themisguard.compliance_service")
+
+
 class ComplianceService:
     def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
-        self.s3 = boto3.client("s3", region_name=settings.AWS_REGION)
+        self.dynamodb = dynamodb
+        self.s3 = get_client("s3")
         self.scans_table = self.dynamodb.Table(settings.DYNAMODB_TABLE_NAME)
 
-    async def analyze_violations(self, assets: Dict[str, Any]) -> List[Violation]:
-        """Analyze GCP assets for HIPAA violations using existing OPA policies"""
+    async def analyze_violations(self, assets: Dict[str, Any]) -> ViolationAnalysis:
+        """Analyze GCP assets for HIPAA violations using existing OPA policies
+
+        The result carries per-severity and per-type counts, tallied once
+        here so callers never re-walk the violation list.
+        """
         violations = []
 
         # Save assets to temporary file for OPA evaluation
@@ -87,7 +98,9 @@ class ComplianceService:
                         violations.append(violation)
 
                 except subprocess.CalledProcessError as e:
-                    print(f"Error running OPA evaluation for {policy['name']}: {e}")
+                    logger.error(
+                        "Error running OPA evaluation for %s: %s", policy["name"], e
+                    )
                     continue
 
         finally:
@@ -97,7 +110,11 @@ class ComplianceService:
             if os.path.exists(temp_assets_file):
                 os.remove(temp_assets_file)
 
-        return violations
+        return ViolationAnalysis(
+            violations=violations,
+            violations_by_severity=Counter(v.severity for v in violations),
+            violations_by_type=Counter(v.type for v in violations),
+        )
 
     def _parse_violation(
         self, violation_text: str, violation_type: ViolationType, index: int
@@ -280,26 +297,14 @@ class ComplianceService:
         return steps
 
     async def store_scan_results(
-        self, user_id: str, project_id: str, violations: List[Violation]
+        self, user_id: str, project_id: str, analysis: ViolationAnalysis
     ) -> str:
         """Store scan results in DynamoDB and S3"""
         scan_id = str(uuid.uuid4())
 
-        # Calculate compliance metrics
-        violation_counts = {
-            ViolationSeverity.CRITICAL: sum(
-                1 for v in violations if v.severity == ViolationSeverity.CRITICAL
-            ),
-            ViolationSeverity.HIGH: sum(
-                1 for v in violations if v.severity == ViolationSeverity.HIGH
-            ),
-            ViolationSeverity.MEDIUM: sum(
-                1 for v in violations if v.severity == ViolationSeverity.MEDIUM
-            ),
-            ViolationSeverity.LOW: sum(
-                1 for v in violations if v.severity == ViolationSeverity.LOW
-            ),
-        }
+        # Compliance metrics come precomputed with the analysis
+        violations = analysis.violations
+        violation_counts = Counter(analysis.violations_by_severity)
 
         # Calculate compliance score (simple formula)
         total_violations = len(violations)
@@ -328,21 +333,53 @@ class ComplianceService:
             compliance_score=compliance_score,
         )
 
-        # Store in DynamoDB
-        try:
-            self.scans_table.put_item(
-                Item={
-                    "scan_id": scan_id,
-                    "user_id": user_id,
-                    "project_id": project_id,
-                    "scan_timestamp": report.scan_timestamp.isoformat(),
-                    "total_violations": total_violations,
-                    "compliance_score": compliance_score,
-                    "status": "completed",
+        # Counts are stored on the summary so dashboards never re-read reports
+        by_severity = {k.value: v for k, v in violation_counts.items()}
+        by_type = {k.value: v for k, v in analysis.violations_by_type.items()}
+
+        # Scan summary, plus the billing usage record when the user has a
+        # subscription, so both commit together
+        transact_items = [
+            {
+                "Put": {
+                    "TableName": self.scans_table.name,
+                    "Item": {
+                        "scan_id": scan_id,
+                        "user_id": user_id,
+                        "project_id": project_id,
+                        "scan_timestamp": report.scan_timestamp.isoformat(),
+                        "total_violations": total_violations,
+                        "violations_by_severity": by_severity,
+                        "violations_by_type": by_type,
+                        "compliance_score": compliance_score,
+                        "status": "completed",
+                    },
                 }
+            }
+        ]
+        try:
+            from .stripe_service import StripeService
+
+            stripe_service = StripeService()
+            usage_item = await stripe_service.build_usage_item(
+                user_id=user_id, scans_count=1, projects_scanned=1, api_calls=0
             )
+            if usage_item:
+                transact_items.append(
+                    {
+                        "Put": {
+                            "TableName": stripe_service.usage_table.name,
+                            "Item": usage_item,
+                        }
+                    }
+                )
+        except Exception as e:
+            # Log error but don't fail the scan
+            logger.error("Failed to record usage for billing: %s", e)
 
-            # Store detailed report in S3
+        try:
+            # Store the detailed report in S3 first, so a failed upload never
+            # leaves a billed scan without a report
             s3_key = f"reports/{user_id}/{scan_id}.json"
             self.s3.put_object(
                 Bucket=settings.S3_BUCKET_NAME,
@@ -351,21 +388,13 @@ class ComplianceService:
                 ContentType="application/json",
             )
 
+            # Then scan summary and usage in one DynamoDB transaction; the
+            # resource's client serializes plain Python values like Table does
+            self.dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+
         except ClientError as e:
             raise Exception(f"Failed to store scan results: {e}")
 
-        # Record usage for billing (async, don't block scan completion)
-        try:
-            from .stripe_service import StripeService
-
-            stripe_service = StripeService()
-            await stripe_service.record_usage(
-                user_id=user_id, scans_count=1, projects_scanned=1, api_calls=0
-            )
-        except Exception as e:
-            # Log error but don't fail the scan
-            print(f"Failed to record usage for billing: {e}")
-
         return scan_id
 
     async def get_scan_report(self, scan_id: str, user_id: str) -> ComplianceReport:
@@ -373,26 +402,39 @@ class ComplianceService:
         try:
             s3_key = f"reports/{user_id}/{scan_id}.json"
             response = self.s3.get_object(Bucket=settings.S3_BUCKET_NAME, Key=s3_key)
-            report_data = json.loads(response["Body"].read())
-            return ComplianceReport(**report_data)
+            return ComplianceReport.model_validate_json(response["Body"].read())
 
         except ClientError as e:
             raise Exception(f"Failed to retrieve scan report: {e}")
 
     async def list_user_reports(
-        self, user_id: str, limit: int = 10, offset: int = 0
-    ) -> List[Dict[str, Any]]:
-        """List all reports for a user"""
+        self,
+        user_id: str,
+        limit: int = 10,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """List a page of reports for a user, newest first
+
+        Pass the returned ``last_evaluated_key`` back as ``exclusive_start_key``
+        to fetch the next page; it is None after the last page.
+        """
         try:
-            response = self.scans_table.query(
-                IndexName="user-index",
-                KeyConditionExpression="user_id = :user_id",
-                ExpressionAttributeValues={":user_id": user_id},
-                Limit=limit,
-                ScanIndexForward=False,  # Get newest first
-            )
-
-            return response.get("Items", [])
+            query_kwargs = {
+                "IndexName": "user-index",
+                "KeyConditionExpression": "user_id = :user_id",
+                "ExpressionAttributeValues": {":user_id": user_id},
+                "Limit": limit,
+                "ScanIndexForward": False,  # Get newest first
+            }
+            if exclusive_start_key:
+                query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+
+            response = self.scans_table.query(**query_kwargs)
+
+            return {
+                "reports": response.get("Items", []),
+                "last_evaluated_key": response.get("LastEvaluatedKey"),
+            }
 
         except ClientError as e:
             raise Exception(f"Failed to list reports: {e}")
@@ -426,11 +468,26 @@ class ComplianceService:
             if scans:
                 last_scan_date = datetime.fromisoformat(scans[0]["scan_timestamp"])
 
+            # Summaries carry their violation counts, so no report is re-read
+            by_severity = Counter()
+            by_type = Counter()
+            for scan in scans:
+                by_severity.update(scan.get("violations_by_severity", {}))
+                by_type.update(scan.get("violations_by_type", {}))
+
             return DashboardData(
                 user_id=user_id,
                 total_scans=total_scans,
                 total_projects=total_projects,
                 overall_compliance_score=overall_compliance_score,
+                violation_summary=ViolationSummary(
+                    total_violations=sum(
+                        scan.get("total_violations", 0) for scan in scans
+                    ),
+                    violations_by_severity=by_severity,
+                    violations_by_type=by_type,
+                    compliance_score=overall_compliance_score,
+                ),
                 last_scan_date=last_scan_date,
             )
 
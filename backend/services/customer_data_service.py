@@ -3,19 +3,23 @@ Customer Data Service - Implements comprehensive data segregation and security
 """
 
 import json
+import logging
+import random
 import uuid
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, Optional
 
-import boto3
-
+from ..core.aws import dynamodb, get_client
 from ..core.config import settings
 from ..models.audit import AccessResult, AuditEvent
 from .audit_service import AuditService
 from .encryption_service import CustomerEncryptionService
 
 
+logger = logging.getLogger("themisguard.customer_data_service")
+
+
 class DataClassification(Enum):
     PUBLIC = "public"
     INTERNAL = "internal"
@@ -77,8 +81,8 @@ class CustomerDataService:
         self.request_context = request_context or {}
 
         # Initialize AWS services
-        self.dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
-        self.s3 = boto3.client("s3", region_name=settings.AWS_REGION)
+        self.dynamodb = dynamodb
+        self.s3 = get_client("s3")
 
         # Initialize security services
         self.encryption_service = CustomerEncryptionService(customer_id)
@@ -117,8 +121,27 @@ class CustomerDataService:
         resource_id: str = None,
         result: AccessResult = AccessResult.SUCCESS,
         error: str = None,
+        data_classification: DataClassification = DataClassification.PHI,
+        routine: bool = False,
     ):
-        """Audit all data access attempts"""
+        """Audit all data access attempts
+
+        Everything this service stores is PHI, so that is the default
+        classification. With AUDIT_SAMPLE_RATE below 1.0, only successful
+        accesses the caller marks routine and classifies below PHI are
+        sampled; all other events are always recorded.
+        """
+        if (
+            routine
+            and result == AccessResult.SUCCESS
+            and data_classification != DataClassification.PHI
+            and random.random() >= settings.AUDIT_SAMPLE_RATE
+        ):
+            return
+
+        # Written before the caller returns: a frozen or recycled container
+        # would lose anything still buffered, and a failed audit write fails
+        # the data access
         await self.audit_service.log_access(
             AuditEvent(
                 user_id=self.user_id,
@@ -132,6 +155,7 @@ class CustomerDataService:
                 user_agent=self.request_context.get("user_agent"),
                 session_id=self.request_context.get("session_id"),
                 timestamp=datetime.utcnow(),
+                data_classification=data_classification.value,
             )
         )
 
@@ -248,7 +272,7 @@ class CustomerDataService:
             table = self.dynamodb.Table(table_name)
 
             # Store in customer-specific table
-            await table.put_item(Item=encrypted_data)
+            table.put_item(Item=encrypted_data)
 
             # Audit successful storage
             await self._audit_access(
@@ -364,8 +388,10 @@ class CustomerDataService:
                     decrypted_items.append(safe_item)
                 except Exception as e:
                     # Log decryption error but continue
-                    print(
-                        f"Failed to decrypt item {item.get('scan_id', 'unknown')}: {e}"
+                    logger.error(
+                        "Failed to decrypt item %s: %s",
+                        item.get("scan_id", "unknown"),
+                        e,
                     )
                     continue
 
@@ -375,9 +401,14 @@ class CustomerDataService:
                 "last_key": response.get("LastEvaluatedKey", {}).get("scan_id"),
             }
 
-            # Audit successful access
+            # Audit successful access; the listing only returns the minimum
+            # necessary metadata above, no PHI
             await self._audit_access(
-                "list_customer_scans", "scan_data", result=AccessResult.SUCCESS
+                "list_customer_scans",
+                "scan_data",
+                result=AccessResult.SUCCESS,
+                data_classification=DataClassification.INTERNAL,
+                routine=True,
             )
 
             return result
@@ -440,7 +471,9 @@ class CustomerDataService:
                         Delete={"Objects": delete_objects},
                     )
             except Exception as s3_error:
-                print(f"Failed to delete S3 objects for scan {scan_id}: {s3_error}")
+                logger.error(
+                    "Failed to delete S3 objects for scan %s: %s", scan_id, s3_error
+                )
 
             # Audit successful deletion
             await self._audit_access(
@@ -571,7 +604,7 @@ class CustomerDataService:
                     table.delete()
                     deletion_counts["tables_deleted"] += 1
                 except Exception as e:
-                    print(f"Failed to delete table {table_name}: {e}")
+                    logger.error("Failed to delete table %s: %s", table_name, e)
 
             # Delete all S3 objects for this customer
             try:
@@ -593,13 +626,13 @@ class CustomerDataService:
                             deletion_counts["s3_objects_deleted"] += len(delete_objects)
 
             except Exception as e:
-                print(f"Failed to delete S3 objects: {e}")
+                logger.error("Failed to delete S3 objects: %s", e)
 
             # Delete customer-specific KMS key
             try:
                 await self.encryption_service.delete_customer_key()
             except Exception as e:
-                print(f"Failed to delete customer KMS key: {e}")
+                logger.error("Failed to delete customer KMS key: %s", e)
 
             # Audit the purge operation
             await self._audit_access(
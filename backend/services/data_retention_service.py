@@ -2,18 +2,21 @@
 Data Retention and Deletion Service - HIPAA compliant data lifecycle management
 """
 
+import logging
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict
 
-import boto3
-
+from ..core.aws import dynamodb, get_client
 from ..core.config import settings
 from ..models.audit import AccessResult, AuditEvent, EventType
 from .audit_service import AuditService
 from .encryption_service import CustomerEncryptionService
 
 
+logger = logging.getLogger("themisguard.data_retention_service")
+
+
 class RetentionPolicy(Enum):
     HIPAA_MINIMUM = "hipaa_minimum"  # 6 years
     EXTENDED = "extended"  # 10 years
@@ -88,13 +91,15 @@ class DataRetentionService:
     }
 
     def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
-        self.s3 = boto3.client("s3", region_name=settings.AWS_REGION)
+        self.dynamodb = dynamodb
+        self.s3 = get_client("s3")
         self.audit_service = AuditService()
 
         # Retention tracking table
         self.retention_table_name = "data-retention-tracker"
         self.deletion_queue_table_name = "deletion-queue"
+        self.retention_table = self.dynamodb.Table(self.retention_table_name)
+        self.deletion_queue_table = self.dynamodb.Table(self.deletion_queue_table_name)
 
     async def schedule_data_for_retention(
         self,
@@ -149,8 +154,7 @@ class DataRetentionService:
             }
 
             # Store retention record
-            retention_table = self.dynamodb.Table(self.retention_table_name)
-            await retention_table.put_item(Item=retention_record)
+            self.retention_table.put_item(Item=retention_record)
 
             # Audit the retention scheduling
             await self.audit_service.log_access(
@@ -207,20 +211,30 @@ class DataRetentionService:
                 "errors": 0,
             }
 
-            # Get all retention records
-            retention_table = self.dynamodb.Table(self.retention_table_name)
-
-            # Scan for expired items
-            response = retention_table.scan(
-                FilterExpression="expiry_date <= :current_time AND #status = :active_status",
-                ExpressionAttributeValues={
+            # Scan for expired items, following LastEvaluatedKey: a single Scan
+            # stops at 1 MB and would silently leave the rest unprocessed.
+            # Only the attributes the deletion/queue paths read are fetched.
+            scan_kwargs = {
+                "FilterExpression": "expiry_date <= :current_time AND #status = :active_status",
+                "ProjectionExpression": (
+                    "retention_id, customer_id, resource_type, resource_id, "
+                    "data_category, expiry_date, deletion_method, requires_approval"
+                ),
+                "ExpressionAttributeValues": {
                     ":current_time": current_time.isoformat(),
                     ":active_status": "active",
                 },
-                ExpressionAttributeNames={"#status": "status"},
-            )
+                "ExpressionAttributeNames": {"#status": "status"},
+            }
+
+            expired_items = []
+            while True:
+                response = self.retention_table.scan(**scan_kwargs)
+                expired_items.extend(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
-            expired_items = response.get("Items", [])
             processing_summary["items_reviewed"] = len(expired_items)
 
             for item in expired_items:
@@ -305,8 +319,7 @@ class DataRetentionService:
             }
 
             # Get all retention records for this customer
-            retention_table = self.dynamodb.Table(self.retention_table_name)
-            response = retention_table.query(
+            response = self.retention_table.query(
                 IndexName="customer-id-index",
                 KeyConditionExpression="customer_id = :customer_id",
                 ExpressionAttributeValues={":customer_id": customer_id},
@@ -421,10 +434,8 @@ class DataRetentionService:
         """
 
         try:
-            retention_table = self.dynamodb.Table(self.retention_table_name)
-
             # Update the retention record
-            response = retention_table.update_item(
+            response = self.retention_table.update_item(
                 Key={"retention_id": retention_id},
                 UpdateExpression="SET expiry_date = :new_expiry, last_reviewed = :reviewed, extension_history = list_append(if_not_exists(extension_history, :empty_list), :extension)",
                 ExpressionAttributeValues={
@@ -493,8 +504,7 @@ class DataRetentionService:
         """
 
         try:
-            retention_table = self.dynamodb.Table(self.retention_table_name)
-            response = retention_table.query(
+            response = self.retention_table.query(
                 IndexName="customer-id-index",
                 KeyConditionExpression="customer_id = :customer_id",
                 ExpressionAttributeValues={":customer_id": customer_id},
@@ -565,15 +575,13 @@ class DataRetentionService:
             return summary
 
         except Exception as e:
-            print(f"Failed to get retention status: {e}")
+            logger.error("Failed to get retention status: %s", e)
             return {}
 
     # Internal helper methods
 
     async def _queue_for_approval(self, item: Dict[str, Any]):
         """Queue item for manual approval before deletion"""
-        deletion_queue_table = self.dynamodb.Table(self.deletion_queue_table_name)
-
         queue_item = {
             "queue_id": f"approval-{item['retention_id']}-{int(datetime.utcnow().timestamp())}",
             "retention_id": item["retention_id"],
@@ -588,7 +596,7 @@ class DataRetentionService:
             "deletion_method": item["deletion_method"],
         }
 
-        await deletion_queue_table.put_item(Item=queue_item)
+        self.deletion_queue_table.put_item(Item=queue_item)
 
     async def _process_automatic_deletion(self, item: Dict[str, Any]) -> bool:
         """Process automatic deletion for items that don't require approval"""
@@ -598,7 +606,9 @@ class DataRetentionService:
                 item, deletion_method, reason="automatic_retention_policy"
             )
         except Exception as e:
-            print(f"Failed automatic deletion for {item['retention_id']}: {e}")
+            logger.error(
+                "Failed automatic deletion for %s: %s", item["retention_id"], e
+            )
             return False
 
     async def _execute_deletion(
@@ -629,8 +639,7 @@ class DataRetentionService:
                 )
 
             # Update retention record
-            retention_table = self.dynamodb.Table(self.retention_table_name)
-            retention_table.update_item(
+            self.retention_table.update_item(
                 Key={"retention_id": item["retention_id"]},
                 UpdateExpression="SET #status = :deleted, deleted_at = :deleted_at, deletion_method = :method, deletion_reason = :reason",
                 ExpressionAttributeNames={"#status": "status"},
@@ -645,7 +654,7 @@ class DataRetentionService:
             return True
 
         except Exception as e:
-            print(f"Failed to execute deletion: {e}")
+            logger.error("Failed to execute deletion: %s", e)
             return False
 
     async def _hard_delete_resource(
@@ -674,7 +683,7 @@ class DataRetentionService:
                             Delete={"Objects": delete_objects},
                         )
         except Exception as e:
-            print(f"Failed to delete S3 objects: {e}")
+            logger.error("Failed to delete S3 objects: %s", e)
 
     async def _soft_delete_resource(
         self, customer_id: str, resource_type: str, resource_id: str
@@ -696,8 +705,6 @@ class DataRetentionService:
 
     async def _queue_for_retry(self, item: Dict[str, Any]):
         """Queue failed deletion for retry"""
-        deletion_queue_table = self.dynamodb.Table(self.deletion_queue_table_name)
-
         queue_item = {
             "queue_id": f"retry-{item['retention_id']}-{int(datetime.utcnow().timestamp())}",
             "retention_id": item["retention_id"],
@@ -710,7 +717,7 @@ class DataRetentionService:
             "deletion_method": item["deletion_method"],
         }
 
-        await deletion_queue_table.put_item(Item=queue_item)
+        self.deletion_queue_table.put_item(Item=queue_item)
 
     async def _handle_processing_error(self, item: Dict[str, Any], error: str):
         """Handle errors during retention processing"""
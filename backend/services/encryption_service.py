@@ -6,15 +6,19 @@ Provides customer-isolated encryption keys and data protection
 import base64
 import hashlib
 import json
+import logging
 from datetime import datetime
 from typing import Any, Dict
 
-import boto3
 from cryptography.fernet import Fernet
 
+from ..core.aws import get_client, session
 from ..core.config import settings
 
 
+logger = logging.getLogger("themisguard.encryption_service")
+
+
 class CustomerEncryptionService:
     """
     Customer-specific encryption service using AWS KMS and envelope encryption
@@ -23,7 +27,7 @@ class CustomerEncryptionService:
 
     def __init__(self, customer_id: str):
         self.customer_id = customer_id
-        self.kms = boto3.client("kms", region_name=settings.AWS_REGION)
+        self.kms = get_client("kms")
         self.customer_key_alias = f"alias/customer-{customer_id}-key"
         self._customer_key_id = None  # Cached key ID
 
@@ -78,7 +82,7 @@ class CustomerEncryptionService:
                     "Sid": "Enable IAM User Permissions",
                     "Effect": "Allow",
                     "Principal": {
-                        "AWS": f"arn:aws:iam::{boto3.Session().get_credentials().access_key}:root"
+                        "AWS": f"arn:aws:iam::{session.get_credentials().access_key}:root"
                     },
                     "Action": "kms:*",
                     "Resource": "*",
@@ -332,7 +336,7 @@ class CustomerEncryptionService:
             return True
 
         except Exception as e:
-            print(f"Failed to delete customer key: {e}")
+            logger.error("Failed to delete customer key: %s", e)
             return False
 
     async def get_key_metadata(self) -> Dict[str, Any]:
@@ -422,7 +426,7 @@ class FieldEncryptionMixin:
                         del decrypted_data[f"{field_name}_hash"]
 
                 except Exception as e:
-                    print(f"Failed to decrypt field {field_name}: {e}")
+                    logger.error("Failed to decrypt field %s: %s", field_name, e)
                     # Keep encrypted version if decryption fails
 
         return decrypted_data
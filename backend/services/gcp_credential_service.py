@@ -1,12 +1,12 @@
 import base64
-import json
 import uuid
 from datetime import datetime
 from typing import Dict
 
-import boto3
+import orjson
 import structlog
 from botocore.exceptions import ClientError
+from core.aws import dynamodb, get_client
 from core.config import settings
 from fastapi import HTTPException
 from google.oauth2 import service_account
@@ -21,8 +21,8 @@ class GCPCredentialService:
     """Secure GCP credential management with KMS encryption"""
 
     def __init__(self):
-        self.kms_client = boto3.client("kms", region_name=settings.AWS_REGION)
-        self.dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
+        self.kms_client = get_client("kms")
+        self.dynamodb = dynamodb
         # Use GCP_CREDENTIALS_TABLE if available, otherwise derive from main table name
         gcp_table_name = getattr(
             settings,
@@ -60,10 +60,10 @@ class GCPCredentialService:
             await self._validate_service_account(service_account_json, project_id)
 
             # Encrypt credentials with KMS
-            credentials_str = json.dumps(service_account_json)
             try:
                 encrypted_response = self.kms_client.encrypt(
-                    KeyId=self.kms_key_alias, Plaintext=credentials_str.encode("utf-8")
+                    KeyId=self.kms_key_alias,
+                    Plaintext=orjson.dumps(service_account_json),
                 )
             except ClientError as e:
                 logger.error("kms_encryption_failed", error=str(e))
@@ -71,17 +71,14 @@ class GCPCredentialService:
                     status_code=500, detail="Failed to encrypt credentials"
                 )
 
-            encrypted_blob = base64.b64encode(
-                encrypted_response["CiphertextBlob"]
-            ).decode("utf-8")
-
             # Store in DynamoDB with encryption metadata
             credential_id = str(uuid.uuid4())
             item = {
                 "user_id": user_id,
                 "project_id": project_id,
                 "credential_id": credential_id,
-                "encrypted_credentials": encrypted_blob,
+                # Raw ciphertext is stored as a Binary attribute
+                "encrypted_credentials": encrypted_response["CiphertextBlob"],
                 "service_account_email": service_account_json["client_email"],
                 "service_account_id": service_account_json.get("client_id", ""),
                 "created_at": datetime.utcnow().isoformat(),
@@ -185,7 +182,12 @@ class GCPCredentialService:
 
             # Decrypt with KMS
             try:
-                encrypted_blob = base64.b64decode(item["encrypted_credentials"])
+                encrypted_blob = item["encrypted_credentials"]
+                if isinstance(encrypted_blob, str):
+                    # Items written before the Binary attribute hold base64 text
+                    encrypted_blob = base64.b64decode(encrypted_blob)
+                else:
+                    encrypted_blob = encrypted_blob.value
                 decrypted_response = self.kms_client.decrypt(
                     CiphertextBlob=encrypted_blob
                 )
@@ -200,9 +202,7 @@ class GCPCredentialService:
                     status_code=500, detail="Failed to decrypt credentials"
                 )
 
-            credentials_json = json.loads(
-                decrypted_response["Plaintext"].decode("utf-8")
-            )
+            credentials_json = orjson.loads(decrypted_response["Plaintext"])
 
             # Update last used timestamp
             self.creds_table.update_item(
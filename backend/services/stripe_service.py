@@ -1,11 +1,18 @@
+import asyncio
+import json
+import logging
 import secrets
+import time
 from datetime import datetime
+from decimal import Decimal
 from typing import Any, Dict, Optional
 
-import boto3
 import stripe
+from fastapi.concurrency import run_in_threadpool
 
+from ..core.aws import dynamodb
 from ..core.config import settings
+from ..core.ttl_cache import put_with_ttl
 from ..models.subscription import (
     THEMISGUARD_PLANS,
     BillingInterval,
@@ -19,13 +26,35 @@ from ..models.subscription import (
 )
 
 
+logger = logging.getLogger("themisguard.stripe_service")
+
+
+# user_id -> (expires_at, result) of recent check_usage_limits calls; the lock
+# per user makes concurrent misses share a single lookup and is dropped once
+# that lookup is done
+USAGE_LIMITS_TTL_SECONDS = 10.0
+USAGE_LIMITS_MAX_ENTRIES = 1024
+_usage_limits_cache: Dict[str, tuple] = {}
+_usage_limits_locks: Dict[str, asyncio.Lock] = {}
+
+
+def to_dynamodb_item(model) -> Dict[str, Any]:
+    """JSON-mode dump of a model with floats as Decimal, as boto3 requires"""
+    return json.loads(model.model_dump_json(), parse_float=Decimal)
+
+
+def invalidate_usage_limits(user_id: str):
+    """Drop a user's cached usage-limit result after billing state changes"""
+    _usage_limits_cache.pop(user_id, None)
+
+
 class StripeService:
     def __init__(self):
         # Set Stripe API key (will be set via environment variables)
         stripe.api_key = settings.STRIPE_SECRET_KEY
 
         # DynamoDB for subscription data
-        self.dynamodb = boto3.resource("dynamodb", region_name=settings.AWS_REGION)
+        self.dynamodb = dynamodb
         self.subscriptions_table = self.dynamodb.Table("themisguard-subscriptions")
         self.usage_table = self.dynamodb.Table("themisguard-usage")
         self.invoices_table = self.dynamodb.Table("themisguard-invoices")
@@ -34,6 +63,14 @@ class StripeService:
         # Stripe webhook endpoint secret
         self.webhook_secret = settings.STRIPE_WEBHOOK_SECRET
 
+        # Webhook event type -> handler; other event types are only recorded
+        self.webhook_handlers = {
+            "customer.subscription.updated": self._handle_subscription_updated,
+            "customer.subscription.deleted": self._handle_subscription_deleted,
+            "invoice.payment_succeeded": self._handle_payment_succeeded,
+            "invoice.payment_failed": self._handle_payment_failed,
+        }
+
     async def create_customer(
         self, user_id: str, email: str, name: str, company: Optional[str] = None
     ) -> str:
@@ -54,7 +91,7 @@ class StripeService:
             return stripe_customer.id
 
         except stripe.error.StripeError as e:
-            print(f"Stripe error creating customer: {e}")
+            logger.error("Stripe error creating customer: %s", e)
             raise Exception(f"Failed to create customer: {str(e)}")
 
     async def create_subscription(
@@ -119,12 +156,13 @@ class StripeService:
             )
 
             # Store in DynamoDB
-            self.subscriptions_table.put_item(Item=subscription.dict())
+            self.subscriptions_table.put_item(Item=to_dynamodb_item(subscription))
+            invalidate_usage_limits(user_id)
 
             return subscription
 
         except stripe.error.StripeError as e:
-            print(f"Stripe error creating subscription: {e}")
+            logger.error("Stripe error creating subscription: %s", e)
             raise Exception(f"Failed to create subscription: {str(e)}")
 
     async def get_customer_subscription(
@@ -132,7 +170,8 @@ class StripeService:
     ) -> Optional[CustomerSubscription]:
         """Get customer's current subscription"""
         try:
-            response = self.subscriptions_table.query(
+            response = await run_in_threadpool(
+                self.subscriptions_table.query,
                 IndexName="customer-id-index",
                 KeyConditionExpression="customer_id = :customer_id",
                 ExpressionAttributeValues={":customer_id": user_id},
@@ -146,7 +185,7 @@ class StripeService:
             return None
 
         except Exception as e:
-            print(f"Error getting customer subscription: {e}")
+            logger.error("Error getting customer subscription: %s", e)
             return None
 
     async def change_subscription(
@@ -190,12 +229,15 @@ class StripeService:
             current_subscription.updated_at = datetime.now()
 
             # Save updated subscription
-            self.subscriptions_table.put_item(Item=current_subscription.dict())
+            self.subscriptions_table.put_item(
+                Item=to_dynamodb_item(current_subscription)
+            )
+            invalidate_usage_limits(request.customer_id)
 
             return current_subscription
 
         except stripe.error.StripeError as e:
-            print(f"Stripe error changing subscription: {e}")
+            logger.error("Stripe error changing subscription: %s", e)
             raise Exception(f"Failed to change subscription: {str(e)}")
 
     async def cancel_subscription(
@@ -220,41 +262,38 @@ class StripeService:
                 subscription.cancel_at_period_end = True
 
             subscription.updated_at = datetime.now()
-            self.subscriptions_table.put_item(Item=subscription.dict())
+            self.subscriptions_table.put_item(Item=to_dynamodb_item(subscription))
+            invalidate_usage_limits(user_id)
 
             return subscription
 
         except stripe.error.StripeError as e:
-            print(f"Stripe error canceling subscription: {e}")
+            logger.error("Stripe error canceling subscription: %s", e)
             raise Exception(f"Failed to cancel subscription: {str(e)}")
 
-    async def record_usage(
+    async def build_usage_item(
         self, user_id: str, scans_count: int, projects_scanned: int, api_calls: int = 0
-    ):
-        """Record usage for billing purposes"""
-        try:
-            subscription = await self.get_customer_subscription(user_id)
-            if not subscription:
-                return  # No subscription, no usage tracking needed
-
-            current_date = datetime.now()
-            month_year = current_date.strftime("%Y-%m")
-
-            usage_record = UsageRecord(
-                usage_id=f"usage_{secrets.token_urlsafe(16)}",
-                customer_id=user_id,
-                subscription_id=subscription.subscription_id,
-                usage_date=current_date,
-                scans_count=scans_count,
-                projects_scanned=projects_scanned,
-                api_calls=api_calls,
-                month_year=month_year,
-            )
-
-            self.usage_table.put_item(Item=usage_record.dict())
-
-        except Exception as e:
-            print(f"Error recording usage: {e}")
+    ) -> Optional[Dict[str, Any]]:
+        """Build the usage table item for a user, or None without a subscription"""
+        subscription = await self.get_customer_subscription(user_id)
+        if not subscription:
+            return None  # No subscription, no usage tracking needed
+
+        current_date = datetime.now()
+        month_year = current_date.strftime("%Y-%m")
+
+        usage_record = UsageRecord(
+            usage_id=f"usage_{secrets.token_urlsafe(16)}",
+            customer_id=user_id,
+            subscription_id=subscription.subscription_id,
+            usage_date=current_date,
+            scans_count=scans_count,
+            projects_scanned=projects_scanned,
+            api_calls=api_calls,
+            month_year=month_year,
+        )
+
+        return to_dynamodb_item(usage_record)
 
     async def get_monthly_usage(
         self, user_id: str, month_year: Optional[str] = None
@@ -264,7 +303,8 @@ class StripeService:
             if not month_year:
                 month_year = datetime.now().strftime("%Y-%m")
 
-            response = self.usage_table.query(
+            response = await run_in_threadpool(
+                self.usage_table.query,
                 IndexName="customer-month-index",
                 KeyConditionExpression="customer_id = :customer_id AND month_year = :month_year",
                 ExpressionAttributeValues={
@@ -295,7 +335,7 @@ class StripeService:
             }
 
         except Exception as e:
-            print(f"Error getting monthly usage: {e}")
+            logger.error("Error getting monthly usage: %s", e)
             return {
                 "scans_count": 0,
                 "projects_scanned": 0,
@@ -304,9 +344,43 @@ class StripeService:
             }
 
     async def check_usage_limits(self, user_id: str) -> Dict[str, Any]:
-        """Check if customer is within their usage limits"""
+        """Check if customer is within their usage limits (cached briefly)"""
+        cached = _usage_limits_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        lock = _usage_limits_locks.setdefault(user_id, asyncio.Lock())
         try:
-            subscription = await self.get_customer_subscription(user_id)
+            async with lock:
+                # Another request may have filled the cache while we waited
+                cached = _usage_limits_cache.get(user_id)
+                if cached and cached[0] > time.monotonic():
+                    return cached[1]
+
+                result = await self._check_usage_limits(user_id)
+                if result.get("reason") != "Error checking limits":
+                    put_with_ttl(
+                        _usage_limits_cache,
+                        user_id,
+                        result,
+                        USAGE_LIMITS_TTL_SECONDS,
+                        USAGE_LIMITS_MAX_ENTRIES,
+                    )
+                return result
+        finally:
+            # Waiters keep their reference and find the cache filled; a later
+            # miss creates a fresh lock
+            if _usage_limits_locks.get(user_id) is lock:
+                del _usage_limits_locks[user_id]
+
+    async def _check_usage_limits(self, user_id: str) -> Dict[str, Any]:
+        """Check usage limits against the current subscription and usage"""
+        try:
+            # Subscription and usage lookups are independent; query both at once
+            subscription, usage = await asyncio.gather(
+                self.get_customer_subscription(user_id),
+                self.get_monthly_usage(user_id),
+            )
             if not subscription:
                 return {"within_limits": False, "reason": "No active subscription"}
 
@@ -319,7 +393,6 @@ class StripeService:
                     "reason": f"Subscription status: {subscription.status}",
                 }
 
-            usage = await self.get_monthly_usage(user_id)
             plan = subscription.plan
 
             # Check scan limit
@@ -353,7 +426,7 @@ class StripeService:
             }
 
         except Exception as e:
-            print(f"Error checking usage limits: {e}")
+            logger.error("Error checking usage limits: %s", e)
             return {"within_limits": False, "reason": "Error checking limits"}
 
     async def create_billing_portal_session(self, user_id: str, return_url: str) -> str:
@@ -372,11 +445,11 @@ class StripeService:
             return session.url
 
         except stripe.error.StripeError as e:
-            print(f"Stripe error creating portal session: {e}")
+            logger.error("Stripe error creating portal session: %s", e)
             raise Exception(f"Failed to create billing portal session: {str(e)}")
 
-    async def handle_webhook(self, payload: str, sig_header: str) -> bool:
-        """Handle Stripe webhook events"""
+    async def handle_webhook(self, payload: bytes, sig_header: str) -> bool:
+        """Handle Stripe webhook events from the raw, unparsed request body"""
         try:
             event = stripe.Webhook.construct_event(
                 payload, sig_header, self.webhook_secret
@@ -390,30 +463,25 @@ class StripeService:
                 data=event["data"],
             )
 
-            self.webhook_events_table.put_item(Item=webhook_event.dict())
+            self.webhook_events_table.put_item(Item=to_dynamodb_item(webhook_event))
 
             # Process specific events
-            if event["type"] == "customer.subscription.updated":
-                await self._handle_subscription_updated(event["data"]["object"])
-            elif event["type"] == "customer.subscription.deleted":
-                await self._handle_subscription_deleted(event["data"]["object"])
-            elif event["type"] == "invoice.payment_succeeded":
-                await self._handle_payment_succeeded(event["data"]["object"])
-            elif event["type"] == "invoice.payment_failed":
-                await self._handle_payment_failed(event["data"]["object"])
+            handler = self.webhook_handlers.get(event["type"])
+            if handler:
+                await handler(event["data"]["object"])
 
             # Mark as processed
             webhook_event.processed = True
             webhook_event.processed_at = datetime.now()
-            self.webhook_events_table.put_item(Item=webhook_event.dict())
+            self.webhook_events_table.put_item(Item=to_dynamodb_item(webhook_event))
 
             return True
 
         except stripe.error.SignatureVerificationError:
-            print("Invalid webhook signature")
+            logger.warning("Invalid webhook signature")
             return False
         except Exception as e:
-            print(f"Error handling webhook: {e}")
+            logger.error("Error handling webhook: %s", e)
             return False
 
     async def _handle_subscription_updated(self, stripe_subscription: Dict[str, Any]):
@@ -437,9 +505,10 @@ class StripeService:
                 subscription_data["updated_at"] = datetime.now().isoformat()
 
                 self.subscriptions_table.put_item(Item=subscription_data)
+                invalidate_usage_limits(subscription_data["customer_id"])
 
         except Exception as e:
-            print(f"Error handling subscription update: {e}")
+            logger.error("Error handling subscription update: %s", e)
 
     async def _handle_subscription_deleted(self, stripe_subscription: Dict[str, Any]):
         """Handle subscription deletion webhook"""
@@ -456,19 +525,20 @@ class StripeService:
                 subscription_data["updated_at"] = datetime.now().isoformat()
 
                 self.subscriptions_table.put_item(Item=subscription_data)
+                invalidate_usage_limits(subscription_data["customer_id"])
 
         except Exception as e:
-            print(f"Error handling subscription deletion: {e}")
+            logger.error("Error handling subscription deletion: %s", e)
 
     async def _handle_payment_succeeded(self, stripe_invoice: Dict[str, Any]):
         """Handle successful payment webhook"""
         # Log successful payment, update customer status, etc.
-        print(f"Payment succeeded for invoice: {stripe_invoice['id']}")
+        logger.info("Payment succeeded for invoice: %s", stripe_invoice["id"])
 
     async def _handle_payment_failed(self, stripe_invoice: Dict[str, Any]):
         """Handle failed payment webhook"""
         # Log failed payment, notify customer, etc.
-        print(f"Payment failed for invoice: {stripe_invoice['id']}")
+        logger.warning("Payment failed for invoice: %s", stripe_invoice["id"])
 
     def get_available_plans(self) -> Dict[str, PricingPlan]:
         """Get all available pricing plans"""
@@ -1,9 +1,7 @@
 import React, { useState, useEffect } from 'react';
-import { useAuth } from '../contexts/AuthContext';
 import { billingAPI } from '../services/api';
 
 const Billing = () => {
-  const { user } = useAuth();
   const [plans, setPlans] = useState([]);
   const [currentSubscription, setCurrentSubscription] = useState(null);
   const [loading, setLoading] = useState(true);
@@ -37,15 +35,8 @@ const Billing = () => {
       setCreating(true);
       setError(null);
 
-      // First create a Stripe customer if needed
-      const customerResponse = await billingAPI.createCustomer({
-        email: user.email,
-        company: 'CompliantGuard Customer'
-      });
-
-      // Then create the subscription
+      // The backend resolves (or creates) the Stripe customer itself
       const subscriptionResponse = await billingAPI.createSubscription({
-        customer_id: customerResponse.data.customer_id,
         plan_tier: planTier,
         billing_interval: billingInterval,
         trial_days: 14
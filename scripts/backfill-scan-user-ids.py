@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Backfill user_id on scan summaries written before reports were listed
+through the user-index GSI
+
+Older summaries were stored without user_id, so they are missing from
+/api/v1/reports and the dashboard. Their "<scan_id>_detailed" twins always
+carried it; this copies it across. Safe to re-run: only summaries that still
+lack user_id are touched.
+"""
+
+import os
+import sys
+
+import boto3
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+
+def find_unowned_summaries(table) -> list:
+    """Scan IDs of summaries without user_id (detailed reports carry violations)"""
+    scan_ids = []
+    scan_kwargs = {
+        "FilterExpression": Attr("user_id").not_exists()
+        & Attr("violations").not_exists(),
+        "ProjectionExpression": "scan_id",
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        scan_ids.extend(item["scan_id"] for item in response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return scan_ids
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def get_owners(dynamodb, table_name: str, scan_ids: list) -> dict:
+    """scan_id -> user_id, read from the detailed twins 100 keys at a time"""
+    owners = {}
+    for start in range(0, len(scan_ids), 100):
+        request_items = {
+            table_name: {
+                "Keys": [
+                    {"scan_id": f"{scan_id}_detailed"}
+                    for scan_id in scan_ids[start : start + 100]
+                ],
+                "ProjectionExpression": "scan_id, user_id",
+            }
+        }
+        while request_items:
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response["Responses"].get(table_name, []):
+                if item.get("user_id"):
+                    owners[item["scan_id"].removesuffix("_detailed")] = item["user_id"]
+            request_items = response.get("UnprocessedKeys")
+    return owners
+
+
+def backfill(table_name: str, region: str, dry_run: bool) -> bool:
+    dynamodb = boto3.resource("dynamodb", region_name=region)
+    table = dynamodb.Table(table_name)
+
+    print(f"📋 Using table: {table_name}")
+    scan_ids = find_unowned_summaries(table)
+    print(f"🔍 Found {len(scan_ids)} scan summaries without user_id")
+    if not scan_ids:
+        return True
+
+    owners = get_owners(dynamodb, table_name, scan_ids)
+    orphaned = [scan_id for scan_id in scan_ids if scan_id not in owners]
+
+    updated = 0
+    for scan_id, user_id in owners.items():
+        if dry_run:
+            print(f"   would set user_id on {scan_id}")
+            continue
+        try:
+            table.update_item(
+                Key={"scan_id": scan_id},
+                UpdateExpression="SET user_id = :user_id",
+                # Never overwrite an owner set since the scan above, and never
+                # create a summary that was deleted in the meantime
+                ConditionExpression="attribute_exists(scan_id) AND "
+                "attribute_not_exists(user_id)",
+                ExpressionAttributeValues={":user_id": user_id},
+            )
+            updated += 1
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                print(f"❌ Failed to update {scan_id}: {e}")
+                return False
+
+    print(f"✅ Updated {updated} summaries")
+    if orphaned:
+        print(f"⚠️  {len(orphaned)} summaries have no detailed report to copy from:")
+        for scan_id in orphaned:
+            print(f"   {scan_id}")
+    return True
+
+
+def main():
+    table_name = os.environ.get("DYNAMODB_TABLE_NAME", "themisguard-scans")
+    region = os.environ.get("AWS_REGION", "us-east-1")
+    dry_run = "--dry-run" in sys.argv[1:]
+
+    success = backfill(table_name, region, dry_run)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()